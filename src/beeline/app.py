@@ -8,23 +8,50 @@ from toga.style.pack import COLUMN, ROW
 from argparse import ArgumentParser
 import pathlib
 import asyncio
-from datetime import datetime
+import copy
+import time
+from collections import deque
 from .inputs import DirPath, FilePath
 
 import argparse
 import sys
 import io
+import traceback
 from typing import Callable, Optional
 
 # Optional: restrict to specific types, e.g. ["json", "csv"]
 FILE_TYPES = None  # None = all files
 
+# Delay before queued lines are written to the terminal widget; lines logged in
+# the meantime are coalesced into the same update
+TERMINAL_FLUSH_INTERVAL = 0.1
+# Scrollback limits for the terminal widget; the oldest lines are dropped first
+TERMINAL_MAX_LINES = 5000
+TERMINAL_MAX_CHARS = 1024 * 1024
+
+# Styles shared by the per-argument form rows. Toga copies a style onto each
+# widget it is applied to, so one instance can be reused across widgets.
+_ROW_STYLE = Pack(direction=ROW, margin=10)
+_LABEL_STYLE = Pack(margin_right=10)
+_BROWSE_BTN_STYLE = Pack(margin_left=8)
+_FLEX_STYLE = Pack(flex=1)
+
+# Argument types that are pure and return immutable values. A parse is only
+# cached when every argument uses one of these; any other type= callable (e.g.
+# FileType, json.loads, a validator) runs again on every Run.
+_CACHEABLE_TYPES = (None, str, int, float, bool, DirPath, FilePath)
+
 
 class _StdoutToTerminal(io.TextIOBase):
-    """Wraps stdout so writes are also sent to the BeeLine terminal widget."""
+    """Wraps stdout so writes are also sent to the BeeLine terminal widget.
+
+    Complete lines are passed to ``append_line`` (the terminal deque's append), then
+    ``request_flush`` is called so they are written to the widget.
+    """
 
-    def __init__(self, log_to_terminal, original_stdout):
-        self._log = log_to_terminal
+    def __init__(self, append_line, request_flush, original_stdout):
+        self._log = append_line
+        self._request_flush = request_flush
         self._original = original_stdout
         self._buffer = ""
 
@@ -32,16 +59,22 @@ class _StdoutToTerminal(io.TextIOBase):
         self._original.write(s)
         if not s:
             return 0
-        self._buffer += s
-        while "\n" in self._buffer:
-            line, self._buffer = self._buffer.split("\n", 1)
+        parts = s.split("\n")
+        if len(parts) == 1:
+            self._buffer += s
+            return len(s)
+        self._log(self._buffer + parts[0])
+        for line in parts[1:-1]:
             self._log(line)
+        self._buffer = parts[-1]
+        self._request_flush()
         return len(s)
 
     def flush(self):
         if self._buffer:
             self._log(self._buffer)
             self._buffer = ""
+            self._request_flush()
         self._original.flush()
 
 
@@ -57,10 +90,35 @@ class BeeLine(toga.App):
         self.parser = parser
         # Store parser actions before calling super().__init__()
         self.parser_actions = parser._actions
+        # Parser actions keyed by dest; fixed once the parser is built
+        self._dest_to_action = {
+            a.dest: a for a in self.parser_actions if a.dest != "help"
+        }
+        # First option string per dest (e.g. "--input_dir"), None for positionals
+        self._primary_flag = {
+            dest: a.option_strings[0] if a.option_strings else None
+            for dest, a in self._dest_to_action.items()
+        }
+        # Form label per dest (replace underscores with spaces, capitalize)
+        self._labels = {
+            dest: dest.replace("_", " ").title() for dest in self._dest_to_action
+        }
         # (dest, widget) for each argument - widget.value gives current value
         self.arg_widgets = []
+        # Raw widget values and Namespace from the last successful parse
+        self._cache_parse = all(
+            a.type in _CACHEABLE_TYPES for a in self._dest_to_action.values()
+        )
+        self._last_parse_key = None
+        self._last_parsed_ns = None
         # Terminal output widget (set in startup)
         self.terminal_output = None
+        # Lines shown in the terminal widget; joined into the widget on flush.
+        # The widget is write-only: its value is never read back. maxlen drops
+        # the oldest lines once the scrollback is full.
+        self._log_lines: deque[str] = deque(maxlen=TERMINAL_MAX_LINES)
+        # True while a flush of the queued lines is scheduled
+        self._flush_scheduled = False
         self._on_run = on_run
         # Initialize the parent Toga App class with required parameters
         super().__init__(
@@ -97,6 +155,10 @@ class BeeLine(toga.App):
 
         return on_browse
 
+    def _read_widget_values(self):
+        """Read each argument widget's value once, in arg_widgets order (parse cache key)."""
+        return tuple([widget.value for _, widget in self.arg_widgets])
+
     def collect_arguments(self):
         """Collect current values from all argument widgets into a dictionary."""
         return {dest: widget.value for dest, widget in self.arg_widgets}
@@ -104,43 +166,76 @@ class BeeLine(toga.App):
     def parse_arguments(self) -> argparse.Namespace:
         """Build argv from current widget values and parse with the app's parser.
 
-        Returns an argparse.Namespace with types applied (e.g. DirPath, FilePath).
+        Returns an argparse.Namespace with types applied (e.g. DirPath, FilePath -> Path).
         Raises if required args are missing or validation fails.
+        When every argument type is in _CACHEABLE_TYPES and the form values are
+        unchanged, a deep copy of the previous result is returned, so callbacks
+        never see values left over from an earlier run.
         """
-        dest_to_action = {a.dest: a for a in self.parser_actions if a.dest != "help"}
+        values = self._read_widget_values()
+        if self._cache_parse and values == self._last_parse_key:
+            return copy.deepcopy(self._last_parsed_ns)
+
         argv = []
-        for dest, widget in self.arg_widgets:
-            action = dest_to_action[dest]
-            value = widget.value
-            option_strings = getattr(action, "option_strings", [])
+        for (dest, _), value in zip(self.arg_widgets, values):
+            action = self._dest_to_action[dest]
+            flag = self._primary_flag[dest]
 
             # Boolean (store_true / store_false): append flag only, no value
             # argparse doesn't set type=bool; these actions have .const set
-            if option_strings and getattr(action, "const", None) is not None:
-                const = action.const
-                if value == const:
-                    argv.append(option_strings[0])
+            if flag and action.const is not None:
+                if value == action.const:
+                    argv.append(flag)
                 continue
 
-            if value is None or (isinstance(value, str) and value.strip() == ""):
+            if value is None or (
+                isinstance(value, str) and (not value or value.isspace())
+            ):
                 if not action.required:
                     continue
-            if option_strings:
-                argv.append(option_strings[0])
-            argv.append(str(value) if value is not None else "")
-        return self.parser.parse_args(argv)
+            value_str = str(value) if value is not None else ""
+            if flag:
+                argv.extend((flag, value_str))
+            else:
+                argv.append(value_str)
+        namespace = self.parser.parse_args(argv)
+        if self._cache_parse:
+            self._last_parse_key = values
+            self._last_parsed_ns = copy.deepcopy(namespace)
+        return namespace
 
     def log_to_terminal(self, text):
-        """Append text to the terminal output area and scroll to bottom."""
+        """Queue a line for the terminal output area (shown on the next flush)."""
+        self._log_lines.append(text)
+        self._request_flush()
+
+    def _flush_terminal(self):
+        """Write the buffered lines to the terminal widget in a single assignment."""
         if not self.terminal_output:
             return
-        current = self.terminal_output.value or ""
-        self.terminal_output.value = current + text + "\n"
+        # Joined length: every line plus its trailing newline
+        size = sum(map(len, self._log_lines)) + len(self._log_lines)
+        while size > TERMINAL_MAX_CHARS and len(self._log_lines) > 1:
+            size -= len(self._log_lines.popleft()) + 1
+        self.terminal_output.value = "\n".join(self._log_lines) + "\n"
         try:
             self.terminal_output.scroll_to_bottom()
         except (AttributeError, TypeError):
             pass
 
+    def _request_flush(self):
+        """Schedule a terminal flush unless one is already pending."""
+        if self._flush_scheduled:
+            return
+        self._flush_scheduled = True
+        self.loop.call_later(TERMINAL_FLUSH_INTERVAL, self._flush_terminal_scheduled)
+
+    def _flush_terminal_scheduled(self):
+        """Run a scheduled flush; lines logged from now on schedule the next one."""
+        # Cleared first so a failing flush doesn't stop later ones being scheduled
+        self._flush_scheduled = False
+        self._flush_terminal()
+
     def on_run(self, widget, **kwargs):
         """Parse args from the form, log to terminal, then call on_run callback if set."""
         try:
@@ -150,7 +245,7 @@ class BeeLine(toga.App):
             return
 
         # Log to terminal
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        timestamp = time.strftime("%H:%M:%S")
         self.log_to_terminal(f"[{timestamp}] Run pressed. Parsed arguments:")
         for k, v in vars(args).items():
             self.log_to_terminal(f"  {k}: {v!r}")
@@ -161,8 +256,6 @@ class BeeLine(toga.App):
                 self._on_run(self, args)
             except Exception as e:
                 self.log_to_terminal(f"Error in on_run callback: {e}\n")
-                import traceback
-
                 self.log_to_terminal(traceback.format_exc())
             return
 
@@ -182,9 +275,7 @@ class BeeLine(toga.App):
             if action.dest == "help":
                 continue
 
-            # Format the label from action.dest (replace underscores with spaces, capitalize)
-            label_text = action.dest.replace("_", " ").title()
-            label = toga.Label(label_text, style=Pack(margin_right=10))
+            label = toga.Label(self._labels[action.dest], style=_LABEL_STYLE)
 
             default = (
                 None
@@ -201,25 +292,25 @@ class BeeLine(toga.App):
                 children.append(
                     toga.Box(
                         children=[label, widget],
-                        style=Pack(direction=ROW, margin=10),
+                        style=_ROW_STYLE,
                     )
                 )
             elif action.type is DirPath or action.type is FilePath:
                 path_input = toga.TextInput(
                     placeholder="No file or folder selected",
-                    style=Pack(flex=1),
+                    style=_FLEX_STYLE,
                 )
                 if default is not None:
                     path_input.value = str(default)
                 browse_btn = toga.Button(
                     "Browse…",
                     on_press=self.create_browse_handler(path_input, action.type),
-                    style=Pack(margin_left=8),
+                    style=_BROWSE_BTN_STYLE,
                 )
                 self.arg_widgets.append((action.dest, path_input))
                 path_row = toga.Box(
                     children=[label, path_input, browse_btn],
-                    style=Pack(direction=ROW, margin=10),
+                    style=_ROW_STYLE,
                 )
                 children.append(path_row)
             elif getattr(action, "const", None) is not None:
@@ -227,45 +318,45 @@ class BeeLine(toga.App):
                 switch_val = default if default is not None else False
                 if action.const is False:
                     switch_val = True if default is None else bool(default)
-                widget = toga.Switch(action.dest, value=switch_val, style=Pack())
+                widget = toga.Switch(action.dest, value=switch_val)
                 self.arg_widgets.append((action.dest, widget))
                 children.append(
                     toga.Box(
                         children=[label, widget],
-                        style=Pack(direction=ROW, margin=10),
+                        style=_ROW_STYLE,
                     )
                 )
             elif action.type is bool:
                 # explicit type=bool: Show a Switch, pass --flag True/False
                 switch_val = default if default is not None else False
-                widget = toga.Switch(action.dest, value=switch_val, style=Pack())
+                widget = toga.Switch(action.dest, value=switch_val)
                 self.arg_widgets.append((action.dest, widget))
                 children.append(
                     toga.Box(
                         children=[label, widget],
-                        style=Pack(direction=ROW, margin=10),
+                        style=_ROW_STYLE,
                     )
                 )
             elif action.type is int:
-                widget = toga.NumberInput(style=Pack(flex=1))
+                widget = toga.NumberInput(style=_FLEX_STYLE)
                 if default is not None:
                     widget.value = int(default)
                 self.arg_widgets.append((action.dest, widget))
                 children.append(
                     toga.Box(
                         children=[label, widget],
-                        style=Pack(direction=ROW, margin=10),
+                        style=_ROW_STYLE,
                     )
                 )
             elif action.type is float:
-                widget = toga.NumberInput(step=0.01, style=Pack(flex=1))
+                widget = toga.NumberInput(step=0.01, style=_FLEX_STYLE)
                 if default is not None:
                     widget.value = float(default)
                 self.arg_widgets.append((action.dest, widget))
                 children.append(
                     toga.Box(
                         children=[label, widget],
-                        style=Pack(direction=ROW, margin=10),
+                        style=_ROW_STYLE,
                     )
                 )
             else:
@@ -273,7 +364,7 @@ class BeeLine(toga.App):
                 placeholder = str(default) if default is not None else "Enter value…"
                 widget = toga.TextInput(
                     placeholder=placeholder,
-                    style=Pack(flex=1),
+                    style=_FLEX_STYLE,
                 )
                 if default is not None:
                     widget.value = str(default)
@@ -281,7 +372,7 @@ class BeeLine(toga.App):
                 children.append(
                     toga.Box(
                         children=[label, widget],
-                        style=Pack(direction=ROW, margin=10),
+                        style=_ROW_STYLE,
                     )
                 )
 
@@ -316,7 +407,9 @@ class BeeLine(toga.App):
         # Route stdout to the terminal widget so any print() (e.g. from on_run callbacks)
         # appears in the GUI without callbacks needing to know about BeeLine.
         self._original_stdout = sys.stdout
-        sys.stdout = _StdoutToTerminal(self.log_to_terminal, self._original_stdout)
+        sys.stdout = _StdoutToTerminal(
+            self._log_lines.append, self._request_flush, self._original_stdout
+        )
 
 
 def main(parser: Optional[ArgumentParser] = None):
@@ -2,18 +2,19 @@
 
 import argparse
 import asyncio
-from datetime import datetime
+import itertools
+import time
 
 from beeline.inputs import DirPath, FilePath
 
 # Ipsum lines for terminal stress test (every 0.5s for 30s)
-IPSUM_LINES = [
+IPSUM_LINES = (
     "Lorem ipsum dolor sit amet, consectetur adipiscing elit.",
     "Sed do eiusmod tempor incididunt ut labore et dolore magna aliqua.",
     "Ut enim ad minim veniam, quis nostrud exercitation ullamco laboris.",
     "Duis aute irure dolor in reprehenderit in voluptate velit esse cillum.",
     "Excepteur sint occaecat cupidatat non proident, sunt in culpa.",
-]
+)
 
 
 def get_parser():
@@ -37,13 +38,16 @@ def demo_on_run(app, args):
     print("Streaming ipsum every 0.5s for 30s…")
     print()
 
-    async def ipsum_stream():
-        for i in range(60):  # 60 * 0.5s = 30s
-            await asyncio.sleep(0.5)
-            line = IPSUM_LINES[i % len(IPSUM_LINES)]
-            ts = datetime.now().strftime("%H:%M:%S")
-            print(f"  [{ts}] {line}")
-        print()
-        print("Ipsum stream finished.")
+    loop = asyncio.get_running_loop()
+    lines = itertools.cycle(IPSUM_LINES)
 
-    asyncio.create_task(ipsum_stream())
+    def emit_ipsum(i):
+        ts = time.strftime("%H:%M:%S")
+        print(f"  [{ts}] {next(lines)}")
+        if i + 1 < 60:  # 60 * 0.5s = 30s
+            loop.call_later(0.5, emit_ipsum, i + 1)
+        else:
+            print()
+            print("Ipsum stream finished.")
+
+    loop.call_later(0.5, emit_ipsum, 0)
@@ -1,3 +1,213 @@
+import argparse
+import io
+import json
+from types import SimpleNamespace
+
+import pytest
+import toga
+
+import beeline.app
+from beeline.app import BeeLine, _StdoutToTerminal
+
+
 def test_first():
     """An initial test for the app."""
     assert 1 + 1 == 2
+
+
+def test_stdout_mirror_splits_lines_across_writes():
+    lines = []
+    original = io.StringIO()
+    mirror = _StdoutToTerminal(lines.append, lambda: None, original)
+    mirror.write("a")
+    mirror.write("b\nc\n\nd")
+    mirror.flush()
+    assert lines == ["ab", "c", "", "d"]
+    assert original.getvalue() == "ab\nc\n\nd"
+
+
+def test_stdout_mirror_requests_flush_on_complete_line():
+    lines = []
+    requests = []
+    mirror = _StdoutToTerminal(lines.append, lambda: requests.append(1), io.StringIO())
+    mirror.write("partial")
+    assert requests == []
+    assert lines == []
+
+    mirror.write(" line\nnext")
+    assert requests == [1]
+    assert lines == ["partial line"]
+
+
+@pytest.fixture
+def make_app(monkeypatch):
+    """Build a BeeLine without starting a GUI backend; widgets are stand-ins with .value."""
+    monkeypatch.setattr(toga.App, "__init__", lambda self, **kwargs: None)
+
+    def _make_app(parser, **values):
+        app = BeeLine(parser)
+        app.arg_widgets = [
+            (dest, SimpleNamespace(value=value)) for dest, value in values.items()
+        ]
+        return app
+
+    return _make_app
+
+
+def _parser():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--name", type=str)
+    parser.add_argument("--count", type=int)
+    parser.add_argument("--tags", nargs="*")
+    return parser
+
+
+def test_parse_cache_returns_copy(make_app):
+    app = make_app(_parser(), name="bee", count="3", tags="x")
+    first = app.parse_arguments()
+    first.name = "changed"
+    first.tags.append("y")
+
+    second = app.parse_arguments()
+    assert second is not first
+    assert second.name == "bee"
+    assert second.tags == ["x"]
+
+
+def test_parse_cache_invalidated_by_form_change(make_app):
+    app = make_app(_parser(), name="bee", count="3", tags="x")
+    assert app.parse_arguments().count == 3
+
+    app.arg_widgets[1][1].value = "4"
+    assert app.parse_arguments().count == 4
+
+
+def test_failed_parse_not_cached(make_app):
+    app = make_app(_parser(), name="bee", count="3", tags="x")
+    app.parse_arguments()
+
+    app.arg_widgets[1][1].value = "not a number"
+    with pytest.raises(SystemExit):
+        app.parse_arguments()
+    with pytest.raises(SystemExit):
+        app.parse_arguments()
+
+    app.arg_widgets[1][1].value = "3"
+    assert app.parse_arguments().count == 3
+
+
+def test_dict_valued_type_not_shared_between_runs(make_app):
+    calls = []
+
+    def config(text):
+        calls.append(text)
+        return json.loads(text)
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cfg", type=config)
+    app = make_app(parser, cfg='{"a": 1}')
+
+    first = app.parse_arguments()
+    first.cfg["a"] = 99
+    second = app.parse_arguments()
+    assert second.cfg == {"a": 1}
+    assert len(calls) == 2
+
+
+def test_mutable_default_not_shared_between_runs(make_app):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--name", type=str)
+    parser.add_argument("--opts", type=str, nargs="*", default=["x"])
+    app = make_app(parser, name="bee")
+
+    app.parse_arguments().opts.append("y")
+    assert app.parse_arguments().opts == ["x"]
+
+
+def test_filetype_arguments_not_cached(make_app, tmp_path):
+    path = tmp_path / "input.txt"
+    path.write_text("data")
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--f", type=argparse.FileType("r"))
+    app = make_app(parser, f=str(path))
+
+    first = app.parse_arguments()
+    first.f.close()
+    second = app.parse_arguments()
+    assert second.f is not first.f
+    assert second.f.read() == "data"
+    second.f.close()
+
+
+class _RecordingLoop:
+    def __init__(self):
+        self.scheduled = []
+
+    def call_later(self, delay, callback, *args):
+        self.scheduled.append(callback)
+
+
+class _BrokenOutput:
+    def __setattr__(self, name, value):
+        raise RuntimeError("widget gone")
+
+
+def test_terminal_flush_scheduled_once_per_burst(make_app):
+    app = make_app(_parser())
+    loop = _RecordingLoop()
+    app._impl = SimpleNamespace(loop=loop)
+    app.log_to_terminal("one")
+    app.log_to_terminal("two")
+    assert len(loop.scheduled) == 1
+
+    # A flush that fails must not stop later lines from scheduling a new one
+    app.terminal_output = _BrokenOutput()
+    with pytest.raises(RuntimeError):
+        loop.scheduled.pop()()
+    app.log_to_terminal("three")
+    assert len(loop.scheduled) == 1
+
+
+class _WriteOnlyOutput:
+    """Terminal widget stand-in that fails if its text is read back."""
+
+    def __init__(self):
+        self.writes = []
+
+    @property
+    def value(self):
+        raise AssertionError("terminal widget must not be read")
+
+    @value.setter
+    def value(self, text):
+        self.writes.append(text)
+
+    def scroll_to_bottom(self):
+        pass
+
+
+def test_terminal_flush_never_reads_widget(make_app):
+    app = make_app(_parser())
+    app.terminal_output = _WriteOnlyOutput()
+    app._log_lines.extend(["one", "two"])
+    app._flush_terminal()
+    app._log_lines.append("three")
+    app._flush_terminal()
+    assert app.terminal_output.writes == ["one\ntwo\n", "one\ntwo\nthree\n"]
+
+
+def test_terminal_flush_trims_oldest_lines_over_size_cap(make_app, monkeypatch):
+    monkeypatch.setattr(beeline.app, "TERMINAL_MAX_CHARS", 10)
+    app = make_app(_parser())
+    app.terminal_output = _WriteOnlyOutput()
+
+    # "aaaa\nbbb\nc\n" is 11 chars: only the oldest line has to go
+    app._log_lines.extend(["aaaa", "bbb", "c"])
+    app._flush_terminal()
+    assert app.terminal_output.writes[-1] == "bbb\nc\n"
+
+    # The newest line is kept even when it alone exceeds the cap
+    app._log_lines.append("d" * 20)
+    app._flush_terminal()
+    assert app.terminal_output.writes[-1] == "d" * 20 + "\n"
+    assert list(app._log_lines) == ["d" * 20]